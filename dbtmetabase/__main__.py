@@ -4,10 +4,9 @@ from pathlib import Path
 from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple, Union, cast
 
 import click
-import yaml
 
 from .core import DbtMetabase
-from .format import Filter, setup_logging
+from .format import Filter, load_yaml, setup_logging
 
 
 def _click_list_option_kwargs() -> Mapping[str, Any]:
@@ -66,7 +65,7 @@ def cli(ctx: click.Context, config_path: str):
     config_path_expanded = Path(config_path).expanduser()
     if config_path_expanded.exists():
         with open(config_path_expanded, encoding="utf-8") as f:
-            config = yaml.safe_load(f).get("config", {})
+            config = load_yaml(f).get("config", {})
             # Propagate common configs to all commands
             common = {k: v for k, v in config.items() if k not in group.commands}
             ctx.default_map = {
@@ -143,7 +143,7 @@ class ExposuresMixin(metaclass=ABCMeta):
 
                 entity: Mapping
                 if exposure.model == "card":
-                    card_entity = self.metabase.find_card(uid=item["id"])
+                    card_entity = self.__find_card(ctx, uid=item["id"])
                     if card_entity is None:
                         _logger.info("Card '%s' not found, skipping", item["id"])
                         continue
@@ -178,7 +178,7 @@ class ExposuresMixin(metaclass=ABCMeta):
                         if "id" not in card:
                             continue
 
-                        if card := self.metabase.find_card(uid=card["id"]):
+                        if card := self.__find_card(ctx, uid=card["id"]):
                             self._exposure_card(ctx, exposure, card)
                 else:
                     _logger.warning("Unexpected collection item '%s'", item["model"])
@@ -193,7 +193,7 @@ class ExposuresMixin(metaclass=ABCMeta):
                     exposure.creator_email = entity["creator"]["email"]
                     exposure.creator_name = entity["creator"]["common_name"]
                 elif "creator_id" in entity:
-                    if creator := self.metabase.find_user(uid=entity["creator_id"]):
+                    if creator := self.__find_user(ctx, uid=entity["creator_id"]):
                         exposure.creator_name = creator.get("common_name", "")
                         exposure.creator_email = creator.get("email", "")
 
@@ -236,6 +236,22 @@ class ExposuresMixin(metaclass=ABCMeta):
 
         return exposures
 
+    def __find_card(self, ctx: _Context, uid: str) -> Optional[Mapping]:
+        """Finds card by ID, reusing previous lookups within one extraction."""
+
+        key = str(uid)
+        if key not in ctx.cards:
+            ctx.cards[key] = self.metabase.find_card(uid=uid)
+        return ctx.cards[key]
+
+    def __find_user(self, ctx: _Context, uid: str) -> Optional[Mapping]:
+        """Finds user by ID, reusing previous lookups within one extraction."""
+
+        key = str(uid)
+        if key not in ctx.users:
+            ctx.users[key] = self.metabase.find_user(uid=uid)
+        return ctx.users[key]
+
     def _exposure_card(self, ctx: _Context, exposure: _Exposure, card: Mapping):
         """Extracts exposures from Metabase questions."""
 
@@ -258,7 +274,7 @@ class ExposuresMixin(metaclass=ABCMeta):
         if isinstance(query_source, str) and query_source.startswith("card__"):
             # Question based on another question
             source_card_uid = query_source.split("__")[-1]
-            if source_card := self.metabase.find_card(uid=source_card_uid):
+            if source_card := self.__find_card(ctx, uid=source_card_uid):
                 self._exposure_card(ctx, exposure, source_card)
 
         elif isinstance(query_source, int) and query_source in ctx.table_names:
@@ -273,7 +289,7 @@ class ExposuresMixin(metaclass=ABCMeta):
             if isinstance(join_source, str) and join_source.startswith("card__"):
                 # Question based on another question
                 source_card_uid = join_source.split("__")[-1]
-                if source_card := self.metabase.find_card(uid=source_card_uid):
+                if source_card := self.__find_card(ctx, uid=source_card_uid):
                     self._exposure_card(ctx, exposure, source_card)
 
                 continue
@@ -293,11 +309,11 @@ class ExposuresMixin(metaclass=ABCMeta):
 
         # Parse common table expressions for exclusion
         ctes: MutableSequence[str] = []
-        for matched_cte in re.findall(_CTE_PARSER, native_query):
+        for matched_cte in _CTE_PARSER.findall(native_query):
             ctes.extend(group.lower() for group in matched_cte if group)
 
         # Parse SQL for exposures through FROM or JOIN clauses
-        for sql_ref in re.findall(_EXPOSURE_PARSER, native_query):
+        for sql_ref in _EXPOSURE_PARSER.findall(native_query):
             sql_ref = sql_ref.strip("`")  # BigQuery uses backticks `dataset.table`
 
             # DATABASE.schema.table -> [database, schema, table]
@@ -431,9 +447,9 @@ class ExposuresMixin(metaclass=ABCMeta):
             if group not in grouped:
                 grouped[group] = exps
 
+        root_path = Path(output_path).expanduser()
         for group, exps in grouped.items():
-            path = Path(output_path).expanduser()
-            path = path.joinpath(*group[:-1]) / f"{group[-1]}.yml"
+            path = root_path.joinpath(*group[:-1], f"{group[-1]}.yml")
             path.parent.mkdir(parents=True, exist_ok=True)
 
             exps_unwrapped = (x["body"] for x in exps)
@@ -454,6 +470,8 @@ class _Context:
     model_refs: Mapping[str, str]
     database_names: Mapping[int, str]
     table_names: Mapping[int, str]
+    cards: MutableMapping[str, Optional[Mapping]] = dc.field(default_factory=dict)
+    users: MutableMapping[str, Optional[Mapping]] = dc.field(default_factory=dict)
 
 
 @dc.dataclass
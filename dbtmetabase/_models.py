@@ -4,11 +4,11 @@ import dataclasses as dc
 import logging
 import time
 from abc import ABCMeta, abstractmethod
-from typing import Any, Iterable, Mapping, MutableMapping, Optional
+from typing import Any, Mapping, MutableMapping, Optional
 
 from .errors import MetabaseStateError
 from .format import Filter, NullValue, safe_name
-from .manifest import DEFAULT_SCHEMA, Column, Group, Manifest, Model
+from .manifest import DEFAULT_SCHEMA, Column, Manifest, Model
 from .metabase import Metabase
 
 _logger = logging.getLogger(__name__)
@@ -64,8 +64,7 @@ class ModelsMixin(metaclass=ABCMeta):
         if not database:
             raise MetabaseStateError(f"Database not found: {metabase_database}")
 
-        models = self.__filtered_models(
-            models=self.manifest.read_models(),
+        models = self.manifest.read_models(
             database_filter=database_filter,
             schema_filter=schema_filter,
             model_filter=model_filter,
@@ -95,10 +94,11 @@ class ModelsMixin(metaclass=ABCMeta):
                     synced = False
                     continue
 
+                table_fields = table.get("fields", {})
                 for column in model.columns:
                     column_name = column.name.upper()
 
-                    field = table.get("fields", {}).get(column_name)
+                    field = table_fields.get(column_name)
                     if not field:
                         if table.get("visibility_type") is not None:
                             table_label = "hidden table"
@@ -257,9 +257,9 @@ class ModelsMixin(metaclass=ABCMeta):
     ):
         """Exports model column order to Metabase field order."""
 
-        api_ord = {}
-        for field in api_table.get("fields", {}).values():
-            api_ord[field["id"]] = field["name"]
+        api_ord = {
+            field["id"]: field["name"] for field in api_table.get("fields", {}).values()
+        }
 
         dbt_ord = {}
         for column in model.columns:
@@ -426,7 +426,7 @@ class ModelsMixin(metaclass=ABCMeta):
                 "Field '%s' will be updated: %s", column_label, ", ".join(body_field)
             )
         else:
-            _logger.info("Field '%s' is up to date", column_label)
+            _logger.debug("Field '%s' is up to date", column_label)
 
         return success
 
@@ -443,42 +443,21 @@ class ModelsMixin(metaclass=ABCMeta):
                 table.get("schema") or bigquery_schema or DEFAULT_SCHEMA
             ).upper()
 
-            fields = {}
-            for field in table.get("fields", []):
-                new_field = field.copy()
-                new_field["kind"] = "field"
-
-                field_name = field["name"].upper()
-                fields[field_name] = new_field
-
-            new_table = table.copy()
-            new_table["kind"] = "table"
-            new_table["fields"] = fields
+            fields = {
+                field["name"].upper(): {**field, "kind": "field"}
+                for field in table.get("fields", [])
+            }
 
             schema_name = table["schema"].upper()
             table_name = table["name"].upper()
-            tables[f"{schema_name}.{table_name}"] = new_table
+            tables[f"{schema_name}.{table_name}"] = {
+                **table,
+                "kind": "table",
+                "fields": fields,
+            }
 
         return tables
 
-    def __filtered_models(
-        self,
-        models: Iterable[Model],
-        database_filter: Optional[Filter],
-        schema_filter: Optional[Filter],
-        model_filter: Optional[Filter],
-        skip_sources: bool,
-    ) -> Iterable[Model]:
-        def selected(m: Model) -> bool:
-            return (
-                (not skip_sources or m.group != Group.sources)
-                and (not database_filter or database_filter.match(m.database))
-                and (not schema_filter or schema_filter.match(m.schema))
-                and (not model_filter or model_filter.match(m.name))
-            )
-
-        return list(filter(selected, models))
-
 
 @dc.dataclass
 class _Context:
@@ -486,7 +465,10 @@ class _Context:
     updates: MutableMapping[str, MutableMapping] = dc.field(default_factory=dict)
 
     def get_field(self, table_key: str, field_key: str) -> MutableMapping:
-        return self.tables.get(table_key, {}).get("fields", {}).get(field_key, {})
+        table = self.tables.get(table_key)
+        if not table:
+            return {}
+        return table.get("fields", {}).get(field_key) or {}
 
     def update(self, entity: MutableMapping, change: Mapping, label: str):
         entity.update(change)
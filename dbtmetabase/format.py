@@ -5,11 +5,23 @@ import logging
 import re
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Any, MutableSequence, Optional, Sequence, TextIO
+from typing import (
+    Any,
+    FrozenSet,
+    MutableSequence,
+    Optional,
+    Pattern,
+    Sequence,
+    TextIO,
+    Tuple,
+)
 
 import yaml
 from rich.logging import RichHandler
 
+# Characters that make a filter item a pattern rather than an exact name
+_WILDCARD_CHARS = frozenset("*?[")
+
 
 class Filter:
     """Inclusion/exclusion filtering."""
@@ -28,21 +40,40 @@ class Filter:
         self.include = self._norm_arg(include)
         self.exclude = self._norm_arg(exclude)
 
+        self._include_names, self._include_wildcards = self._compile(self.include)
+        self._exclude_names, self._exclude_wildcards = self._compile(self.exclude)
+
     def match(self, item: Optional[str]) -> bool:
         item = self._norm_item(item) if item else ""
 
-        for exclude in self.exclude:
-            if fnmatch.fnmatch(item, exclude):
-                return False
+        if self._matches(item, self._exclude_names, self._exclude_wildcards):
+            return False
 
         if self.include:
-            for include in self.include:
-                if fnmatch.fnmatch(item, include):
-                    return True
-            return False
+            return self._matches(item, self._include_names, self._include_wildcards)
 
         return True
 
+    @staticmethod
+    def _matches(
+        item: str,
+        names: FrozenSet[str],
+        wildcards: Optional[Pattern[str]],
+    ) -> bool:
+        return item in names or (wildcards is not None and bool(wildcards.match(item)))
+
+    @staticmethod
+    def _compile(
+        patterns: Sequence[str],
+    ) -> Tuple[FrozenSet[str], Optional[Pattern[str]]]:
+        """Splits patterns into exact names (hash lookup) and one combined wildcard regex."""
+
+        names = frozenset(x for x in patterns if not _WILDCARD_CHARS.intersection(x))
+        wildcards = [
+            fnmatch.translate(x) for x in patterns if _WILDCARD_CHARS.intersection(x)
+        ]
+        return names, re.compile("|".join(wildcards)) if wildcards else None
+
     @staticmethod
     def _norm_arg(arg: Optional[Sequence[str]]) -> Sequence[str]:
         if isinstance(arg, str):
@@ -54,6 +85,15 @@ class Filter:
         return x.upper()
 
 
+# Non-word characters in friendly names
+_SAFE_NAME_PARSER = re.compile(r"[^\w]")
+# Jinja expressions in long text, e.g. {{ variable }}
+_JINJA_PARSER = re.compile(r"{{(.*?)}}")
+
+# libyaml-backed loader when available, pure Python otherwise
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 class _YAMLDumper(yaml.Dumper):
     """Custom YAML dumper for uniform formatting."""
 
@@ -71,6 +111,18 @@ class _NullValue(str):
 NullValue = _NullValue()
 
 
+def load_yaml(stream: TextIO) -> Any:
+    """Uniform way to safely load object from YAML file.
+
+    Args:
+        stream (TextIO): Text file handle.
+
+    Returns:
+        Any: Payload.
+    """
+    return yaml.load(stream, Loader=_YAMLLoader)
+
+
 def dump_yaml(data: Any, stream: TextIO):
     """Uniform way to dump object to YAML file.
 
@@ -140,7 +192,7 @@ def safe_name(text: Optional[str]) -> str:
     Returns:
         str: Sanitized lowercase string with underscores.
     """
-    return re.sub(r"[^\w]", "_", text or "").lower()
+    return _SAFE_NAME_PARSER.sub("_", text or "").lower()
 
 
 def safe_description(text: Optional[str]) -> str:
@@ -152,4 +204,4 @@ def safe_description(text: Optional[str]) -> str:
     Returns:
         str: Sanitized string with escaped Jinja syntax.
     """
-    return re.sub(r"{{(.*?)}}", r"(\1)", text or "")
+    return _JINJA_PARSER.sub(r"(\1)", text or "")
@@ -4,8 +4,10 @@ import dataclasses as dc
 import json
 import logging
 import re
+import sys
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 from typing import (
     Any,
     Iterable,
@@ -14,10 +16,11 @@ from typing import (
     MutableSequence,
     Optional,
     Sequence,
+    Tuple,
     Union,
 )
 
-from .format import NullValue
+from .format import Filter, NullValue
 
 _logger = logging.getLogger(__name__)
 
@@ -42,10 +45,23 @@ _MODEL_META_FIELDS = _COMMON_META_FIELDS + [
     "caveats",
 ]
 
+# Pairs of (field, namespaced meta key), formatted once
+_COLUMN_META_KEYS = tuple((f, f"{_META_NS}.{f}") for f in _COLUMN_META_FIELDS)
+_MODEL_META_KEYS = tuple((f, f"{_META_NS}.{f}") for f in _MODEL_META_FIELDS)
+_META_FK_TARGET_TABLE = f"{_META_NS}.fk_target_table"
+_META_FK_TARGET_FIELD = f"{_META_NS}.fk_target_field"
+# Absent meta field (None is a valid explicit value)
+_MISSING = object()
+# Shared read-only fallback for absent manifest mappings
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 # Default values for non-standard sources
 DEFAULT_DATABASE = ""
 DEFAULT_SCHEMA = "PUBLIC"
 
+# Slotted dataclasses for leaner model/column instances (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # Foreign key constraint: "schema.model (column)" / "model (column)"
 _CONSTRAINT_FK_PARSER = re.compile(r"(?P<model>.+)\s+\((?P<column>.+)\)")
 
@@ -62,9 +78,23 @@ class Manifest:
 
         self.path = Path(path).expanduser()
 
-    def read_models(self) -> Sequence[Model]:
+    def read_models(
+        self,
+        database_filter: Optional[Filter] = None,
+        schema_filter: Optional[Filter] = None,
+        model_filter: Optional[Filter] = None,
+        skip_sources: bool = False,
+    ) -> Sequence[Model]:
         """Reads dbt models in Metabase-friendly format.
 
+        Filtered out models are skipped before their columns and relationships are read.
+
+        Args:
+            database_filter (Optional[Filter], optional): Filter dbt manifest by database. Defaults to None.
+            schema_filter (Optional[Filter], optional): Filter dbt manifest by schema. Defaults to None.
+            model_filter (Optional[Filter], optional): Filter dbt manifest by model. Defaults to None.
+            skip_sources (bool, optional): Exclude dbt sources. Defaults to False.
+
         Returns:
             Sequence[Model]: List of dbt models in Metabase-friendly format.
         """
@@ -74,24 +104,31 @@ class Manifest:
 
         models: MutableSequence[Model] = []
 
-        for node in manifest["nodes"].values():
-            if node["resource_type"] != "model":
-                continue
-
-            name = node["name"]
-            if node["config"]["materialized"] == "ephemeral":
-                _logger.debug("Skipping ephemeral model '%s'", name)
+        for group, resource_type in _GROUP_RESOURCE_TYPES:
+            if skip_sources and group == Group.sources:
                 continue
 
-            models.append(self._read_model(manifest, node, Group.nodes))
+            for node in manifest[group].values():
+                if node["resource_type"] != resource_type:
+                    continue
 
-        for node in manifest["sources"].values():
-            if node["resource_type"] != "source":
-                continue
+                if group == Group.nodes:
+                    if node["config"]["materialized"] == "ephemeral":
+                        _logger.debug("Skipping ephemeral model '%s'", node["name"])
+                        continue
+                    source = None
+                else:
+                    source = node["source_name"]
+
+                if not (
+                    (not database_filter or database_filter.match(node["database"]))
+                    and (not schema_filter or schema_filter.match(node["schema"]))
+                    and (not model_filter or model_filter.match(node["name"]))
+                ):
+                    _logger.debug("Skipping filtered model '%s'", node["name"])
+                    continue
 
-            models.append(
-                self._read_model(manifest, node, Group.sources, node["source_name"])
-            )
+                models.append(self._read_model(manifest, node, group, source))
 
         return models
 
@@ -105,35 +142,32 @@ class Manifest:
         database = manifest_model["database"]
         schema = manifest_model["schema"]
         unique_id = manifest_model["unique_id"]
+        name = manifest_model["name"]
+        alias = manifest_model.get("alias") or manifest_model.get("identifier") or name
 
         relationships = self._read_relationships(manifest, group, unique_id)
 
         columns = [
             self._read_column(column, schema, relationships.get(column["name"]))
-            for column in manifest_model.get("columns", {}).values()
+            for column in (manifest_model.get("columns") or _EMPTY).values()
         ]
 
-        meta = self._scan_fields(
-            manifest_model.get("meta", {}),
-            fields=_MODEL_META_FIELDS,
-            ns=_META_NS,
-        )
-        description = meta.pop("description", manifest_model.get("description"))
+        meta = manifest_model.get("meta")
+        fields = self._scan_fields(meta, fields=_MODEL_META_KEYS) if meta else {}
+        description = fields.pop("description", manifest_model.get("description"))
 
         return Model(
             database=database,
             schema=schema,
             group=group,
-            name=manifest_model["name"],
-            alias=manifest_model.get(
-                "alias", manifest_model.get("identifier", manifest_model["name"])
-            ),
+            name=name,
+            alias=alias,
             description=description,
             columns=columns,
             unique_id=unique_id,
             source=source,
             tags=manifest_model.get("tags", []),
-            **meta,
+            **fields,
         )
 
     def _read_column(
@@ -142,21 +176,19 @@ class Manifest:
         schema: str,
         relationship: Optional[Mapping],
     ) -> Column:
-        meta = self._scan_fields(
-            manifest_column.get("meta", {}),
-            fields=_COLUMN_META_FIELDS,
-            ns=_META_NS,
-        )
-        description = meta.pop("description", manifest_column.get("description"))
+        meta = manifest_column.get("meta")
+        fields = self._scan_fields(meta, fields=_COLUMN_META_KEYS) if meta else {}
+        description = fields.pop("description", manifest_column.get("description"))
 
         column = Column(
             name=manifest_column.get("name", ""),
             description=description,
-            **meta,
+            **fields,
         )
 
         self._set_column_relationship(
             manifest_column=manifest_column,
+            meta=meta,
             column=column,
             schema=schema,
             relationship=relationship,
@@ -172,9 +204,10 @@ class Manifest:
     ) -> Mapping[str, Mapping[str, str]]:
         relationships = {}
 
+        group_nodes = manifest.get(group) or _EMPTY
         for child_id in manifest["child_map"][unique_id]:
-            child = manifest.get(group, {}).get(child_id, {})
-            child_name = child.get("alias", child.get("name"))
+            child = group_nodes.get(child_id) or _EMPTY
+            child_name = child.get("alias") or child.get("name")
 
             if (
                 child.get("resource_type") == "test"
@@ -268,12 +301,17 @@ class Manifest:
     def _set_column_relationship(
         self,
         manifest_column: Mapping,
+        meta: Optional[Mapping],
         column: Column,
         schema: str,
         relationship: Optional[Mapping],
     ):
         """Sets primary key and foreign key target on a column from constraints, meta fields or provided test relationship."""
 
+        constraints = manifest_column.get("constraints")
+        if not relationship and not constraints and not meta:
+            return
+
         fk_target_table = ""
         fk_target_field = ""
 
@@ -283,7 +321,7 @@ class Manifest:
             fk_target_field = relationship["fk_target_field"]
 
         # Precedence 2: Constraints
-        for constraint in manifest_column.get("constraints", []):
+        for constraint in constraints or ():
             if constraint["type"] == "primary_key":
                 if not column.semantic_type:
                     column.semantic_type = "type/PK"
@@ -302,9 +340,9 @@ class Manifest:
                     )
 
         # Precedence 3: Meta fields
-        meta = manifest_column.get("meta", {})
-        fk_target_table = meta.get(f"{_META_NS}.fk_target_table", fk_target_table)
-        fk_target_field = meta.get(f"{_META_NS}.fk_target_field", fk_target_field)
+        if meta:
+            fk_target_table = meta.get(_META_FK_TARGET_TABLE, fk_target_table)
+            fk_target_field = meta.get(_META_FK_TARGET_FIELD, fk_target_field)
 
         if not fk_target_table or not fk_target_field:
             if fk_target_table or fk_target_table:
@@ -330,23 +368,22 @@ class Manifest:
 
     @staticmethod
     def _scan_fields(
-        t: Mapping, fields: Iterable[str], ns: str
+        t: Mapping, fields: Iterable[Tuple[str, str]]
     ) -> MutableMapping[str, Any]:
         """Reads meta fields from a schem object.
 
         Args:
             t (Mapping): Target to scan for fields.
-            fields (Iterable): List of fields to accept.
-            ns (str): Field namespace (separated by .).
+            fields (Iterable): Pairs of accepted field and its namespaced key (separated by .).
 
         Returns:
             Mapping: Field values.
         """
 
         vals = {}
-        for field in fields:
-            if f"{ns}.{field}" in t:
-                value = t[f"{ns}.{field}"]
+        for field, key in fields:
+            value = t.get(key, _MISSING)
+            if value is not _MISSING:
                 vals[field] = value if value is not None else NullValue
         return vals
 
@@ -365,7 +402,14 @@ class Group(str, Enum):
         return None
 
 
-@dc.dataclass
+# Manifest groups and the resource type read from each, in output order
+_GROUP_RESOURCE_TYPES = (
+    (Group.nodes, "model"),
+    (Group.sources, "source"),
+)
+
+
+@dc.dataclass(**_DATACLASS_SLOTS)
 class Column:
     name: str
     description: Optional[str] = None
@@ -382,7 +426,7 @@ class Column:
     meta_fields: MutableMapping = dc.field(default_factory=dict)
 
 
-@dc.dataclass
+@dc.dataclass(**_DATACLASS_SLOTS)
 class Model:
     database: str
     schema: str
@@ -7,7 +7,8 @@ import requests
 from dotenv import dotenv_values
 
 from dbtmetabase.core import DbtMetabase
-from dbtmetabase.manifest import Column, Manifest, Model
+from dbtmetabase.format import Filter
+from dbtmetabase.manifest import Column, Group, Manifest, Model
 from dbtmetabase.metabase import Metabase
 
 FIXTURES_PATH = Path("tests") / "fixtures"
@@ -79,10 +80,23 @@ class MockMetabase(Metabase):
 class MockManifest(Manifest):
     _models: Sequence[Model] = []
 
-    def read_models(self) -> Sequence[Model]:
+    def read_models(
+        self,
+        database_filter: Optional[Filter] = None,
+        schema_filter: Optional[Filter] = None,
+        model_filter: Optional[Filter] = None,
+        skip_sources: bool = False,
+    ) -> Sequence[Model]:
         if not self._models:
             self._models = super().read_models()
-        return self._models
+        return [
+            m
+            for m in self._models
+            if (not skip_sources or m.group != Group.sources)
+            and (not database_filter or database_filter.match(m.database))
+            and (not schema_filter or schema_filter.match(m.schema))
+            and (not model_filter or model_filter.match(m.name))
+        ]
 
     def find_model(self, model_name: str) -> Optional[Model]:
         filtered = [m for m in self._models if m.name == model_name]
@@ -59,6 +59,21 @@ def test_exposures_grouping_type(core: MockDbtMetabase):
         _assert_exposures(file, output_path / "dashboard" / file.name)
 
 
+def test_exposures_cards_fetched_once(core: MockDbtMetabase, monkeypatch):
+    fetched = []
+    find_card = core.metabase.find_card
+
+    def counting_find_card(uid: str):
+        fetched.append(str(uid))
+        return find_card(uid=uid)
+
+    monkeypatch.setattr(core.metabase, "find_card", counting_find_card)
+    core.extract_exposures(output_path=str(TMP_PATH / "exposure" / "cached"))
+
+    assert fetched
+    assert len(fetched) == len(set(fetched))
+
+
 @pytest.mark.parametrize(
     ("query", "expected"),
     [
@@ -1,4 +1,11 @@
-from dbtmetabase.format import Filter, NullValue, dump_yaml, safe_description, safe_name
+from dbtmetabase.format import (
+    Filter,
+    NullValue,
+    dump_yaml,
+    load_yaml,
+    safe_description,
+    safe_name,
+)
 from tests._mocks import FIXTURES_PATH, TMP_PATH
 
 
@@ -20,6 +27,10 @@ def test_filter_wildcard():
     assert not Filter(include="order?").match("ordersz")
     assert Filter(include="*orders", exclude="stg_*").match("_orders")
     assert not Filter(include="*orders", exclude="stg_*").match("stg_orders")
+    assert Filter(include=("orders", "stg_*")).match("stg_payments")
+    assert Filter(include=("orders", "stg_*")).match("ORDERS")
+    assert not Filter(include=("orders", "stg_*")).match("payments")
+    assert Filter(include="order[sz]").match("orderz")
 
 
 def test_null_value():
@@ -71,3 +82,15 @@ def test_dump_yaml():
     with open(fixture_path, "r", encoding="utf-8") as f:
         expected = f.read()
     assert actual == expected
+
+
+def test_load_yaml():
+    fixture_path = FIXTURES_PATH / "test_dump_yaml.yml"
+    with open(fixture_path, "r", encoding="utf-8") as f:
+        actual = load_yaml(f)
+    assert actual == {
+        "root": {
+            "attr1": "val1\nend",
+            "attr2": ["val2", "val3"],
+        },
+    }
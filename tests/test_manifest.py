@@ -1,6 +1,7 @@
 from operator import attrgetter
 from typing import Sequence
 
+from dbtmetabase.format import Filter
 from dbtmetabase.manifest import Column, Group, Manifest, Model
 from tests._mocks import FIXTURES_PATH, MockManifest
 
@@ -18,6 +19,16 @@ def test_v11_disabled():
     assert customer_id_col.fk_target_field is None
 
 
+def test_v12_filtered():
+    models = Manifest(FIXTURES_PATH / "manifest-v12.json").read_models(
+        schema_filter=Filter(include="public"),
+        model_filter=Filter(include="stg_*", exclude="stg_payments"),
+        skip_sources=True,
+    )
+    assert sorted(m.name for m in models) == ["stg_customers", "stg_orders"]
+    assert all(m.group == Group.nodes for m in models)
+
+
 def test_v12():
     models = Manifest(FIXTURES_PATH / "manifest-v12.json").read_models()
     _assert_models_equal(